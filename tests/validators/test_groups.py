@@ -9,9 +9,13 @@
 # @author Davide Brunato <brunato@sissa.it>
 #
 import unittest
+import gc
+import pickle
+import weakref
+from collections.abc import MutableSequence, Sequence
 from typing import Any, Union, List, Optional
 
-from xmlschema import XMLSchemaModelError, XMLSchemaModelDepthError
+from xmlschema import XMLSchema10, XMLSchemaModelError, XMLSchemaModelDepthError
 from xmlschema.exceptions import XMLSchemaValueError
 from xmlschema.validators.particles import ParticleMixin
 from xmlschema.validators.groups import XsdGroup
@@ -66,11 +70,98 @@ class TestXsdGroups(unittest.TestCase):
         del group[0]
         self.assertListEqual(group[:], [('c',)])
 
+    def test_model_group_sequence_methods(self):
+        group = ModelGroup('sequence')
+        self.assertIsInstance(group, Sequence)
+        self.assertIsInstance(group, MutableSequence)
+        self.assertNotIn(MutableSequence, ModelGroup.__mro__)
+        particles = [ParticleMixin(), ParticleMixin(min_occurs=0), ParticleMixin()]
+
+        group.extend(particles[:2])
+        group += particles[2:]
+        self.assertListEqual(list(group), particles)
+        self.assertListEqual(list(reversed(group)), particles[::-1])
+        self.assertIn(particles[1], group)
+        self.assertNotIn(ParticleMixin(), group)
+        self.assertEqual(group.index(particles[2]), 2)
+        self.assertEqual(group.count(particles[0]), 1)
+
+        self.assertFalse(group.is_emptiable())
+        group.remove(particles[0])
+        group.remove(particles[2])
+        self.assertTrue(group.is_emptiable())
+        group.append(particles[0])
+        self.assertFalse(group.is_emptiable())
+        self.assertIs(group.pop(), particles[0])
+        self.assertTrue(group.is_emptiable())
+
+        group.append(particles[0])
+        group.reverse()
+        self.assertListEqual(group[:], [particles[0], particles[1]])
+
     def test_is_empty(self):
         group = ModelGroup('all')
         self.assertTrue(group.is_empty())
         group.append(('A',))
         self.assertFalse(group.is_empty())
+        group.max_occurs = 0
+        self.assertTrue(group.is_empty())
+        group.max_occurs = 1
+        self.assertFalse(group.is_empty())
+        group.mixed = True
+        self.assertFalse(group.is_empty())
+        group.mixed = False
+        group.clear()
+        self.assertTrue(group.is_empty())
+
+    def test_is_emptiable(self):
+        group = ModelGroup('sequence')
+        self.assertTrue(group.is_emptiable())
+        group.append(ParticleMixin(min_occurs=0))
+        group.append(ParticleMixin())
+        self.assertFalse(group.is_emptiable())
+        group.model = 'choice'
+        self.assertTrue(group.is_emptiable())
+
+        group[0].min_occurs = 1
+        self.assertFalse(group.is_emptiable())
+        group.min_occurs = 0
+        self.assertTrue(group.is_emptiable())
+
+    def test_is_single(self):
+        root_group = group = ModelGroup('sequence')
+        self.assertFalse(root_group.is_single())
+        for _ in range(3):
+            group.append(ModelGroup('sequence'))
+            group = group[0]
+        self.assertFalse(root_group.is_single())
+
+        group.append(ParticleMixin())
+        self.assertTrue(root_group.is_single())
+        group.max_occurs = 2
+        self.assertFalse(root_group.is_single())
+
+        # Model group with an excessive depth
+        root_group = group = ModelGroup('sequence')
+        for _ in range(18):
+            group.append(ModelGroup('sequence'))
+            group = group[0]
+
+        with self.assertRaises(XMLSchemaModelDepthError):
+            root_group.is_single()
+
+    def test_is_missing(self):
+        group = ModelGroup('sequence')
+        self.assertFalse(group.is_missing(0))
+        group.append(ParticleMixin(min_occurs=0))
+        self.assertFalse(group.is_missing(0))
+        group.append(ParticleMixin())
+        self.assertTrue(group.is_missing(0))
+        self.assertFalse(group.is_missing(1))
+
+        group.min_occurs = 2
+        self.assertTrue(group.is_missing(1))
+        self.assertFalse(group.is_missing(2))
 
     def test_is_pointless(self):
         root_group = ModelGroup('choice')
@@ -102,6 +193,12 @@ class TestXsdGroups(unittest.TestCase):
         self.assertTrue(group.is_pointless(parent=root_group))
         group.append(('B',))
         self.assertTrue(group.is_pointless(parent=root_group))
+        group.max_occurs = 2
+        self.assertFalse(group.is_pointless(parent=root_group))
+        group.max_occurs = 1
+        self.assertTrue(group.is_pointless(parent=root_group))
+        root_group.model = 'sequence'
+        self.assertFalse(group.is_pointless(parent=root_group))
 
     def test_effective_min_occurs(self):
         group = ModelGroup('sequence')
@@ -177,6 +274,16 @@ class TestXsdGroups(unittest.TestCase):
             self.assertFalse(group.has_occurs_restriction(other=ParticleMixin()))
             self.assertTrue(group.has_occurs_restriction(other=ParticleMixin(1, None)))
 
+        group = ModelGroup('sequence')
+        group.append(ParticleMixin(0, None))
+        self.assertFalse(group.has_occurs_restriction(other=ParticleMixin(0, 5)))
+        self.assertTrue(group.has_occurs_restriction(other=ParticleMixin(0, None)))
+        group[0].max_occurs = 2
+        self.assertTrue(group.has_occurs_restriction(other=ParticleMixin(0, 2)))
+        group.append(ParticleMixin())
+        self.assertFalse(group.has_occurs_restriction(other=ParticleMixin(0, 2)))
+        self.assertTrue(group.has_occurs_restriction(other=ParticleMixin(1, 3)))
+
     def test_iter_model(self):
         # Model group with pointless inner groups
         root_group = group = ModelGroup('sequence')
@@ -280,6 +387,80 @@ class TestXsdGroups(unittest.TestCase):
         with self.assertRaises(XMLSchemaModelError):
             root_group.get_subgroups(ParticleMixin())
 
+        # The returned list is a copy of the cached path
+        root_group.get_subgroups(group).clear()
+        self.assertListEqual(root_group.get_subgroups(group), subgroups)
+
+        # Changes of nested groups are reflected on the paths of the model
+        particle = ParticleMixin()
+        subgroups[-2].insert(0, particle)
+        self.assertListEqual(root_group.get_subgroups(particle), subgroups[:-1])
+        del subgroups[-2][0]
+        with self.assertRaises(XMLSchemaModelError):
+            root_group.get_subgroups(particle)
+
+        # Changes of a group shared by more models are reflected on all of them
+        shared_group = ModelGroup('choice')
+        shared_group.append(ParticleMixin())
+        root_group = ModelGroup('sequence')
+        root_group.append(ModelGroup('sequence', max_occurs=2))
+        root_group[0].append(shared_group)
+        other_group = ModelGroup('choice')
+        other_group.extend([ParticleMixin(), shared_group])
+
+        particle = ParticleMixin()
+        self.assertListEqual(root_group.get_subgroups(shared_group[0]),
+                             [root_group, root_group[0], shared_group])
+        self.assertListEqual(other_group.get_subgroups(shared_group[0]),
+                             [other_group, shared_group])
+        shared_group.append(particle)
+        self.assertListEqual(root_group.get_subgroups(particle),
+                             [root_group, root_group[0], shared_group])
+        self.assertListEqual(other_group.get_subgroups(particle), [other_group, shared_group])
+
+        # Changes of nested groups of parsed models and of their copies
+        schema = XMLSchema10("""<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:group name="nested">
+              <xs:choice>
+                <xs:element name="b"/>
+                <xs:element name="c"/>
+              </xs:choice>
+            </xs:group>
+            <xs:complexType name="rootType">
+              <xs:sequence>
+                <xs:element name="a"/>
+                <xs:group ref="nested" maxOccurs="2"/>
+              </xs:sequence>
+            </xs:complexType>
+          </xs:schema>""")
+
+        root_group = schema.types['rootType'].content
+        nested_group = schema.groups['nested']
+        root_group_copy = root_group.copy()
+        self.assertListEqual(root_group.get_subgroups(nested_group[0]),
+                             [root_group, root_group[1], nested_group])
+        self.assertListEqual(root_group_copy.get_subgroups(nested_group[0]),
+                             [root_group_copy, root_group[1], nested_group])
+
+        particle = ParticleMixin()
+        nested_group.append(particle)
+        self.assertListEqual(root_group.get_subgroups(particle),
+                             [root_group, root_group[1], nested_group])
+        self.assertListEqual(root_group_copy.get_subgroups(particle),
+                             [root_group_copy, root_group[1], nested_group])
+
+        # Links between groups are restored on unpickled models
+        schema = pickle.loads(pickle.dumps(schema))
+        root_group = schema.types['rootType'].content
+        nested_group = schema.groups['nested']
+        self.assertListEqual(root_group.get_subgroups(nested_group[-1]),
+                             [root_group, root_group[1], nested_group])
+
+        particle = ParticleMixin()
+        nested_group.append(particle)
+        self.assertListEqual(root_group.get_subgroups(particle),
+                             [root_group, root_group[1], nested_group])
+
         # Model group with an excessive depth
         root_group = group = ModelGroup('sequence')
         for k in range(18):
@@ -290,6 +471,96 @@ class TestXsdGroups(unittest.TestCase):
         with self.assertRaises(XMLSchemaModelDepthError):
             root_group.get_subgroups(group)
 
+        # Particles not nested too deep are found anyway
+        particle = ParticleMixin()
+        root_group.append(particle)
+        self.assertListEqual(root_group.get_subgroups(particle), [root_group])
+        self.assertListEqual(root_group.get_subgroups(root_group[1][0]),
+                             [root_group, root_group[1]])
+
+        with self.assertRaises(XMLSchemaModelError):
+            root_group.get_subgroups(ParticleMixin())
+
+    def test_removed_groups(self):
+        nested_group = ModelGroup('choice')
+        root_group = ModelGroup('sequence')
+        root_group.extend([nested_group, ParticleMixin(), nested_group])
+        self.assertSetEqual(set(nested_group._containers), {root_group})
+
+        del root_group[0]
+        self.assertSetEqual(set(nested_group._containers), {root_group})
+        root_group.pop()
+        self.assertSetEqual(set(nested_group._containers), set())
+
+        root_group.insert(0, nested_group)
+        root_group[0] = ParticleMixin()
+        self.assertSetEqual(set(nested_group._containers), set())
+
+        root_group[:] = [nested_group]
+        root_group.remove(nested_group)
+        self.assertSetEqual(set(nested_group._containers), set())
+
+        root_group.append(nested_group)
+        root_group.clear()
+        self.assertSetEqual(set(nested_group._containers), set())
+
+    def test_garbage_collection(self):
+        schema_refs = []
+        for _ in range(10):
+            schema = XMLSchema10("""<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+                <xs:complexType name="rootType">
+                  <xs:complexContent>
+                    <xs:extension base="xs:annotated"/>
+                  </xs:complexContent>
+                </xs:complexType>
+              </xs:schema>""")
+            schema_refs.append(weakref.ref(schema))
+
+        del schema
+        gc.collect()
+        self.assertListEqual([ref() for ref in schema_refs], [None] * 10)
+
+    def test_pointless_groups_after_build(self):
+        schema = XMLSchema10("""<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root">
+              <xs:complexType>
+                <xs:sequence>
+                  <xs:element name="a"/>
+                  <xs:sequence>
+                    <xs:element name="b"/>
+                    <xs:choice>
+                      <xs:element name="c"/>
+                    </xs:choice>
+                  </xs:sequence>
+                </xs:sequence>
+              </xs:complexType>
+            </xs:element>
+          </xs:schema>""")
+
+        # The pointless state of nested groups is recorded by the build
+        group = schema.elements['root'].type.content
+        self.assertDictEqual(group[1]._pointless, {'sequence': True})
+        self.assertDictEqual(group[1][1]._pointless, {'sequence': True})
+
+        elements = [group[0], group[1][0], group[1][1][0]]
+        self.assertListEqual(list(group.iter_model()), elements)
+
+        # Building other schemas doesn't affect the model
+        XMLSchema10("""<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+            <xs:element name="root"/>
+          </xs:schema>""")
+        self.assertDictEqual(group[1]._pointless, {'sequence': True})
+        self.assertListEqual(list(group.iter_model()), elements)
+
+        # Changes of nested groups are reflected on the model
+        group[1][1].max_occurs = 2
+        self.assertListEqual(list(group.iter_model()), elements[:2] + [group[1][1]])
+        group[1].min_occurs = 0
+        self.assertListEqual(list(group.iter_model()), [group[0], group[1]])
+        group[1].min_occurs = 1
+        group[1][1].max_occurs = 1
+        self.assertListEqual(list(group.iter_model()), elements)
+
     def test_overall_min_occurs(self):
         root_group = group = ModelGroup('sequence')
         subgroups = []
@@ -339,6 +610,11 @@ class TestXsdGroups(unittest.TestCase):
         self.assertEqual(root_group.overall_max_occurs(group), 6)
         root_group[1].max_occurs = None
         self.assertIsNone(root_group.overall_max_occurs(group))
+        subgroups[-1].max_occurs = 0
+        self.assertEqual(root_group.overall_max_occurs(group), 0)
+        subgroups[-1].max_occurs = 1
+        group.max_occurs = 0
+        self.assertEqual(root_group.overall_max_occurs(group), 0)
 
 
 if __name__ == '__main__':
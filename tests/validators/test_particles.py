@@ -134,6 +134,10 @@ class TestParticleMixin(unittest.TestCase):
         elem = ElementTree.Element('root', minOccurs='1', maxOccurs='1')
         xsd_element._parse_particle(elem)
 
+        elem = ElementTree.Element('root', minOccurs=' +0 ', maxOccurs=' 3')
+        xsd_element._parse_particle(elem)
+        self.assertEqual(xsd_element.occurs, (0, 3))
+
         elem = ElementTree.Element('root', minOccurs='2', maxOccurs='1')
         with self.assertRaises(XMLSchemaParseError) as ctx:
             xsd_element._parse_particle(elem)
@@ -11,10 +11,11 @@
 This module contains classes for XML Schema model groups.
 """
 import warnings
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, MutableSequence
 from copy import copy as _copy
-from typing import TYPE_CHECKING, cast, overload, Any, Iterable, Iterator, \
-    List, MutableSequence, Optional, Tuple, Union
+from typing import TYPE_CHECKING, cast, overload, Any, Dict, Iterable, Iterator, \
+    List, Optional, Tuple, Union
+from weakref import WeakSet
 from xml.etree import ElementTree
 
 from .. import limits
@@ -48,12 +49,13 @@ ANY_ELEMENT = ElementTree.Element(
         'maxOccurs': 'unbounded'
     })
 
+XSD_CONTENT_MODEL_TAGS = frozenset((XSD_SEQUENCE, XSD_ALL, XSD_CHOICE))
+
 GroupDecodeType = List[Tuple[Union[str, int], Any, Optional[SchemaElementType]]]
 GroupEncodeType = Tuple[Optional[str], List[ElementType]]
 
 
-class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
-               ParticleMixin, ValidationMixin[ElementType, GroupDecodeType]):
+class XsdGroup(XsdComponent, ParticleMixin, ValidationMixin[ElementType, GroupDecodeType]):
     """
     Class for XSD 1.0 *model group* definitions.
 
@@ -92,7 +94,6 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
         </sequence>
     """
     parent: Optional[Union['XsdComplexType', 'XsdGroup']]
-    model: str
     mixed: bool = False
     ref: Optional['XsdGroup']
     restriction: Optional['XsdGroup'] = None
@@ -103,6 +104,23 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
 
     _ADMITTED_TAGS = {XSD_GROUP, XSD_SEQUENCE, XSD_ALL, XSD_CHOICE}
 
+    is_group = True
+
+    _model: str
+    _min_occurs: int = 1
+    _max_occurs: Optional[int] = 1
+
+    # Lazily computed data on the structure of the model, discarded when it's
+    # older than the model version. The version is incremented at every change
+    # of the content or of the occurrences of the group and of the groups nested
+    # into it, that register the group as one of their containers.
+    _model_version = 0
+    _cache_version = -1
+    _containers: Optional['WeakSet[XsdGroup]'] = None
+    _subgroups: Optional[Tuple[Dict[int, Tuple['XsdGroup', ...]], bool]] = None
+    _pointless: Dict[str, bool]
+    _empty: bool
+
     def __init__(self, elem: ElementType,
                  schema: SchemaType,
                  parent: Optional[Union['XsdComplexType', 'XsdGroup']] = None) -> None:
@@ -126,44 +144,203 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
                 self.__class__.__name__, self.prefixed_name, self.model, list(self.occurs)
             )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop('_containers', None)
+        state.pop('_cache_version', None)  # cached paths are mapped by id()
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._add_container(self._group)
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @model.setter
+    def model(self, value: str) -> None:
+        self._model = value
+        self._model_changed()
+
+    @property
+    def min_occurs(self) -> int:
+        return self._min_occurs
+
+    @min_occurs.setter
+    def min_occurs(self, value: int) -> None:
+        self._min_occurs = value
+        self._model_changed()
+
+    @property
+    def max_occurs(self) -> Optional[int]:
+        return self._max_occurs
+
+    @max_occurs.setter
+    def max_occurs(self, value: Optional[int]) -> None:
+        self._max_occurs = value
+        self._model_changed()
+
     @overload
     def __getitem__(self, i: int) -> ModelParticleType: ...
 
     @overload
-    def __getitem__(self, s: slice) -> MutableSequence[ModelParticleType]: ...
+    def __getitem__(self, s: slice) -> List[ModelParticleType]: ...
 
     def __getitem__(self, i: Union[int, slice]) \
-            -> Union[ModelParticleType, MutableSequence[ModelParticleType]]:
+            -> Union[ModelParticleType, List[ModelParticleType]]:
         return self._group[i]
 
     def __setitem__(self, i: Union[int, slice], o: Any) -> None:
-        self._group[i] = o
+        if isinstance(i, slice):
+            items, removed = list(o), self._group[i]
+            self._group[i] = items
+        else:
+            items, removed = [o], [self._group[i]]
+            self._group[i] = o
+        self._remove_container(removed)
+        self._add_container(items)
+        self._model_changed()
 
     def __delitem__(self, i: Union[int, slice]) -> None:
+        removed = self._group[i] if isinstance(i, slice) else [self._group[i]]
         del self._group[i]
+        self._remove_container(removed)
+        self._model_changed()
 
     def __len__(self) -> int:
         return len(self._group)
 
     def insert(self, i: int, item: ModelParticleType) -> None:
         self._group.insert(i, item)
+        self._add_container((item,))
+        self._model_changed()
 
     def clear(self) -> None:
+        removed = self._group[:]
         del self._group[:]
+        self._remove_container(removed)
+        self._model_changed()
+
+    # Sequence methods are delegated to the list of particles, without
+    # inheriting from MutableSequence, for having a shorter MRO. The class
+    # is registered as a virtual subclass of MutableSequence.
+    def __iter__(self) -> Iterator[ModelParticleType]:
+        return iter(self._group)
+
+    def __reversed__(self) -> Iterator[ModelParticleType]:
+        return reversed(self._group)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._group
+
+    def index(self, item: ModelParticleType, *args: int) -> int:
+        return self._group.index(item, *args)
+
+    def count(self, item: ModelParticleType) -> int:
+        return self._group.count(item)
+
+    def append(self, item: ModelParticleType) -> None:
+        self._group.append(item)
+        self._add_container((item,))
+        self._model_changed()
+
+    def extend(self, items: Iterable[ModelParticleType]) -> None:
+        items = list(items)
+        self._group.extend(items)
+        self._add_container(items)
+        self._model_changed()
+
+    def pop(self, i: int = -1) -> ModelParticleType:
+        item = self._group.pop(i)
+        self._remove_container((item,))
+        self._model_changed()
+        return item
+
+    def remove(self, item: ModelParticleType) -> None:
+        self._group.remove(item)
+        self._remove_container((item,))
+        self._model_changed()
+
+    def reverse(self) -> None:
+        self._group.reverse()
+        self._model_changed()
+
+    def __iadd__(self, items: Iterable[ModelParticleType]) -> 'XsdGroup':
+        self.extend(items)
+        return self
+
+    def _add_container(self, items: Iterable[ModelParticleType]) -> None:
+        """
+        Registers the group as a container of the model groups among the items.
+        The containers are weakly referenced, for not keeping alive the models
+        that include a group of another schema (e.g. a group of the meta-schema).
+        """
+        for item in items:
+            if getattr(item, 'is_group', False):  # items could be not particles
+                containers = cast(XsdGroup, item)._containers
+                if containers is None:
+                    containers = cast(XsdGroup, item)._containers = WeakSet()
+                containers.add(self)
+
+    def _remove_container(self, items: Iterable[ModelParticleType]) -> None:
+        """Unregisters the group from the model groups removed from its content."""
+        for item in items:
+            if getattr(item, 'is_group', False):
+                containers = cast(XsdGroup, item)._containers
+                if containers is not None and all(x is not item for x in self._group):
+                    containers.discard(self)
+
+    def _model_changed(self) -> None:
+        """Increments the model version of the group and of the groups that contain it."""
+        self._model_version += 1
+        if not self._containers:
+            return
+
+        changed = {id(self)}
+        containers = list(self._containers)
+        while containers:
+            group = containers.pop()
+            if id(group) not in changed:
+                changed.add(id(group))
+                group._model_version += 1
+                if group._containers:
+                    containers.extend(group._containers)
+
+    def _check_cache(self) -> None:
+        """Discards lazily computed data if the model has changed since its computation."""
+        model_version = self._model_version
+        if self._cache_version != model_version:
+            self._subgroups = None
+            self._pointless = {}
+            self._empty = not self._group or self.max_occurs == 0
+            self._cache_version = model_version  # set last, after the reset of data
 
     def is_emptiable(self) -> bool:
         if self.model == 'choice':
-            return self.min_occurs == 0 or not self or any(item.is_emptiable() for item in self)
+            return self.min_occurs == 0 or not self._group or \
+                any(item.is_emptiable() for item in self._group)
         else:
-            return self.min_occurs == 0 or not self or all(item.is_emptiable() for item in self)
+            return self.min_occurs == 0 or not self._group or \
+                all(item.is_emptiable() for item in self._group)
+
+    def is_missing(self, occurs: int) -> bool:
+        return not self.is_emptiable() if occurs == 0 else self.min_occurs > occurs
 
     def is_single(self) -> bool:
-        if self.max_occurs != 1 or not self:
-            return False
-        elif len(self) > 1 or not isinstance(self[0], XsdGroup):
-            return True
-        else:
-            return self[0].is_single()
+        group = self
+        depth = 0
+        while True:
+            if group.max_occurs != 1 or not group._group:
+                return False
+            elif len(group._group) > 1 or not group._group[0].is_group:
+                return True
+
+            # Single nested group: iterate instead of recursing into it
+            group = cast(XsdGroup, group._group[0])
+            depth += 1
+            if depth > limits.MAX_MODEL_DEPTH:
+                raise XMLSchemaModelDepthError(self)
 
     def is_pointless(self, parent: 'XsdGroup') -> bool:
         """
@@ -179,130 +356,161 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
 
         :param parent: effective parent of the model group.
         """
-        if not self:
-            return True
+        if self._cache_version != self._model_version:
+            self._check_cache()
+
+        # Read the cache once, it could be replaced by a concurrent reset
+        pointless_map = self._pointless
+        pointless = pointless_map.get(parent.model)
+        if pointless is not None:
+            return pointless
+
+        if not self._group:
+            pointless = True
         elif self.min_occurs != 1 or self.max_occurs != 1:
-            return False
-        elif len(self) == 1:
-            return True
+            pointless = False
+        elif len(self._group) == 1:
+            pointless = True
         elif self.model == 'sequence' and parent.model != 'sequence':
-            return False
+            pointless = False
         elif self.model == 'choice' and parent.model != 'choice':
-            return False
+            pointless = False
         else:
-            return True
+            pointless = True
+
+        # The outcome depends on the parent only for its model
+        pointless_map[parent.model] = pointless
+        return pointless
 
     @property
     def effective_min_occurs(self) -> int:
-        if not self.min_occurs or not self:
+        if not self.min_occurs or not self._group:
             return 0
 
-        effective_items: List[Any]
-        min_occurs: int
-        effective_items = [e for e in self.iter_model() if e.effective_max_occurs != 0]
-        if not effective_items:
+        # Single pass on model items, skipping the not effective ones. The reduced
+        # value is the min for choice models, the max for all models and the value
+        # of the only not emptiable item for sequence models.
+        min_occurs: Optional[int] = None
+        not_emptiable_count = 0
+
+        for e in self.iter_model():
+            if e.effective_max_occurs == 0:
+                continue
+
+            effective_min_occurs = e.effective_min_occurs
+            if self.model == 'choice':
+                if min_occurs is None or min_occurs > effective_min_occurs:
+                    min_occurs = effective_min_occurs
+            elif self.model == 'all':
+                if min_occurs is None or min_occurs < effective_min_occurs:
+                    min_occurs = effective_min_occurs
+            elif effective_min_occurs:
+                not_emptiable_count += 1
+                if not_emptiable_count > 1:
+                    return self.min_occurs
+                min_occurs = effective_min_occurs
+
+        if min_occurs is None:
             return 0
-        elif self.model == 'choice':
-            min_occurs = min(e.effective_min_occurs for e in effective_items)
-            return self.min_occurs * min_occurs
         elif self.model == 'all':
-            min_occurs = max(e.effective_min_occurs for e in effective_items)
             return min_occurs
-
-        not_emptiable_items = [e for e in effective_items if e.effective_min_occurs]
-        if not not_emptiable_items:
-            return 0
-        elif len(not_emptiable_items) > 1:
-            return self.min_occurs
-
-        min_occurs = not_emptiable_items[0].effective_min_occurs
-        return self.min_occurs * min_occurs
+        else:
+            return self.min_occurs * min_occurs
 
     @property
     def effective_max_occurs(self) -> Optional[int]:
-        if self.max_occurs == 0 or not self:
+        if self.max_occurs == 0 or not self._group:
             return 0
 
-        effective_items: List[Any]
-        max_occurs: int
+        # Single pass on model items, reducing effective maxOccurs of all the
+        # items and of the not emptiable items (not used for choice models).
+        max_occurs: Optional[int] = 0
+        not_emptiable_count = 0
+        not_emptiable_max_occurs: Optional[int] = None
+        not_emptiable_min_max_occurs: Optional[int] = None
 
-        model_items = [(e, e.effective_max_occurs) for e in self.iter_model()]
-        effective_items = [x for x in model_items if x[1] != 0]
-        if not effective_items:
-            return 0
+        for e in self.iter_model():
+            effective_max_occurs = e.effective_max_occurs
+            if effective_max_occurs == 0:
+                continue
+            elif effective_max_occurs is None:
+                max_occurs = None
+            elif max_occurs is not None and max_occurs < effective_max_occurs:
+                max_occurs = effective_max_occurs
+
+            if self.model != 'choice' and e.effective_min_occurs:
+                not_emptiable_count += 1
+                if not_emptiable_count == 1:
+                    not_emptiable_max_occurs = effective_max_occurs
+                if effective_max_occurs is not None and (
+                        not_emptiable_min_max_occurs is None or
+                        not_emptiable_min_max_occurs > effective_max_occurs):
+                    not_emptiable_min_max_occurs = effective_max_occurs
+
+        if max_occurs == 0:
+            return 0  # no effective items
         elif self.max_occurs is None:
             return None
-        elif self.model == 'choice':
-            if any(x[1] is None for x in effective_items):
-                return None
-            else:
-                max_occurs = max(x[1] for x in effective_items)
-                return self.max_occurs * max_occurs
-
-        not_emptiable_items = [x for x in effective_items if x[0].effective_min_occurs]
-        if not not_emptiable_items:
-            if any(x[1] is None for x in effective_items):
-                return None
-            else:
-                max_occurs = max(x[1] for x in effective_items)
-                return self.max_occurs * max_occurs
-
-        elif len(not_emptiable_items) > 1:
+        elif self.model == 'choice' or not not_emptiable_count:
+            return None if max_occurs is None else self.max_occurs * max_occurs
+        elif not_emptiable_count > 1:
             if self.model == 'sequence':
                 return self.max_occurs
-            elif all(x[1] is None for x in not_emptiable_items):
-                return None
-            else:
-                max_occurs = min(x[1] for x in not_emptiable_items if x[1] is not None)
-                return max_occurs
-        elif not_emptiable_items[0][1] is None:
+            return not_emptiable_min_max_occurs
+        elif not_emptiable_max_occurs is None:
             return None
         else:
-            return self.max_occurs * cast(int, not_emptiable_items[0][1])
+            return self.max_occurs * not_emptiable_max_occurs
 
     def has_occurs_restriction(
             self, other: Union[ModelParticleType, ParticleMixin, 'OccursCalculator']) -> bool:
 
-        if not self:
+        if not self._group:
             return True
         elif isinstance(other, XsdGroup):
             return super(XsdGroup, self).has_occurs_restriction(other)
 
         # Group particle compared to element particle
-        if self.max_occurs is None or any(e.max_occurs is None for e in self):
-            if other.max_occurs is not None:
-                return False
-            elif self.model == 'choice':
-                return self.min_occurs * min(e.min_occurs for e in self) >= other.min_occurs
-            else:
-                return self.min_occurs * sum(e.min_occurs for e in self) >= other.min_occurs
+        if self.max_occurs is None and other.max_occurs is not None:
+            return False
 
-        elif self.model == 'choice':
-            if self.min_occurs * min(e.min_occurs for e in self) < other.min_occurs:
-                return False
-            elif other.max_occurs is None:
-                return True
-            else:
-                value: int
-                try:
-                    value = max(e.max_occurs for e in self)  # type: ignore[type-var, assignment]
-                except TypeError:
-                    return False
-                else:
-                    return self.max_occurs * value <= other.max_occurs
+        if len(self._group) == 1:
+            # Fast path for the common case of a group with a single particle
+            item = self._group[0]
+            min_occurs = item.min_occurs
+            unbounded = item.max_occurs is None
+            max_occurs = 0 if item.max_occurs is None else item.max_occurs
+        else:
+            # Reduce items occurrences in a single pass: for choice models
+            # the min/max values are used, for other models the sums.
+            min_occurs = self._group[0].min_occurs
+            max_occurs = sum_min_occurs = sum_max_occurs = 0
+            unbounded = False
+            for e in self._group:
+                sum_min_occurs += e.min_occurs
+                if e.min_occurs < min_occurs:
+                    min_occurs = e.min_occurs
+
+                if e.max_occurs is None:
+                    if other.max_occurs is not None:
+                        return False
+                    unbounded = True
+                elif not unbounded:
+                    sum_max_occurs += e.max_occurs
+                    if e.max_occurs > max_occurs:
+                        max_occurs = e.max_occurs
 
+            if self.model != 'choice':
+                min_occurs, max_occurs = sum_min_occurs, sum_max_occurs
+
+        if self.min_occurs * min_occurs < other.min_occurs:
+            return False
+        elif other.max_occurs is None:
+            return True
+        elif self.max_occurs is None or unbounded:
+            return False
         else:
-            if self.min_occurs * sum(e.min_occurs for e in self) < other.min_occurs:
-                return False
-            elif other.max_occurs is None:
-                return True
-            else:
-                try:
-                    value = sum(e.max_occurs for e in self)  # type: ignore[misc]
-                except TypeError:
-                    return False
-                else:
-                    return self.max_occurs * value <= other.max_occurs
+            return self.max_occurs * max_occurs <= other.max_occurs
 
     def iter_model(self) -> Iterator[ModelParticleType]:
         """
@@ -316,7 +524,7 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
 
         while True:
             for item in particles:
-                if isinstance(item, XsdGroup) and item.is_pointless(parent=self):
+                if item.is_group and cast(XsdGroup, item).is_pointless(parent=self):
                     iterators.append(particles)
                     particles = iter(item)
                     if len(iterators) > limits.MAX_MODEL_DEPTH:
@@ -343,14 +551,14 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
 
         while True:
             for item in particles:
-                if isinstance(item, XsdGroup):
+                if item.is_group:
                     iterators.append(particles)
                     particles = iter(item)
                     if len(iterators) > limits.MAX_MODEL_DEPTH:
                         raise XMLSchemaModelDepthError(self)
                     break
                 else:
-                    yield item
+                    yield item  # type: ignore[misc]
             else:
                 try:
                     particles = iterators.pop()
@@ -360,36 +568,68 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
     def get_subgroups(self, item: ModelParticleType) -> List['XsdGroup']:
         """
         Returns a list of the groups that represent the path to the enclosed particle.
-        Raises an `XMLSchemaModelError` if *item* is not a particle of the model group.
+        Raises an `XMLSchemaModelError` if *item* is not a particle of the model group
+        or an `XMLSchemaModelDepthError` if *item* is not found and the model has groups
+        nested over `limits.MAX_MODEL_DEPTH` value.
+        """
+        return list(self._get_subgroups(item))
+
+    def _get_subgroups(self, item: ModelParticleType) -> Tuple['XsdGroup', ...]:
+        """Returns the cached path of groups that enclose the particle, without copying it."""
+        self._check_cache()
+        subgroups = self._subgroups
+        if subgroups is None:
+            subgroups = self._subgroups = self._map_subgroups()
+
+        subgroups_map, depth_exceeded = subgroups
+        try:
+            return subgroups_map[id(item)]
+        except KeyError:
+            if depth_exceeded:
+                raise XMLSchemaModelDepthError(self) from None
+            msg = _('{!r} is not a particle of the model group')
+            raise XMLSchemaModelError(self, msg.format(item)) from None
+
+    def _map_subgroups(self) -> Tuple[Dict[int, Tuple['XsdGroup', ...]], bool]:
+        """
+        Maps the particles of the model group to the paths of the groups that
+        enclose them. A particle that occurs more times is mapped to its first path.
+        The content of groups nested over the max depth is not mapped: returns also
+        a boolean that is `True` if the mapping has been cut by the depth limit.
         """
+        subgroups_map: Dict[int, Tuple[XsdGroup, ...]] = {}
         subgroups: List[Tuple[XsdGroup, Iterator[ModelParticleType]]] = []
         group, children = self, iter(self)
+        path: Tuple[XsdGroup, ...] = (self,)
+        depth_exceeded = False
 
         while True:
             for child in children:
-                if child is item:
-                    _subgroups = [x[0] for x in subgroups]
-                    _subgroups.append(group)
-                    return _subgroups
-                elif isinstance(child, XsdGroup):
+                if id(child) not in subgroups_map:
+                    subgroups_map[id(child)] = path
+                if child.is_group:
                     if len(subgroups) > limits.MAX_MODEL_DEPTH:
-                        raise XMLSchemaModelDepthError(self)
+                        depth_exceeded = True
+                        continue
                     subgroups.append((group, children))
-                    group, children = child, iter(child)
+                    group = cast(XsdGroup, child)
+                    children = iter(group)
+                    path += (group,)
                     break
             else:
                 try:
                     group, children = subgroups.pop()
                 except IndexError:
-                    msg = _('{!r} is not a particle of the model group')
-                    raise XMLSchemaModelError(self, msg.format(item)) from None
+                    return subgroups_map, depth_exceeded
+                else:
+                    path = path[:-1]
 
     def overall_min_occurs(self, item: ModelParticleType) -> int:
         """Returns the overall min occurs of a particle in the model."""
         min_occurs = item.min_occurs
 
-        for group in self.get_subgroups(item):
-            if group.model == 'choice' and len(group) > 1:
+        for group in self._get_subgroups(item):
+            if group.model == 'choice' and len(group._group) > 1:
                 return 0
             min_occurs *= group.min_occurs
 
@@ -398,24 +638,29 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
     def overall_max_occurs(self, item: ModelParticleType) -> Optional[int]:
         """Returns the overall max occurs of a particle in the model."""
         max_occurs = item.max_occurs
+        if max_occurs == 0:
+            return 0
 
-        for group in self.get_subgroups(item):
-            if max_occurs == 0:
+        # Once unbounded only a zero maxOccurs of an enclosing group can change the result
+        unbounded = max_occurs is None
+        for group in self._get_subgroups(item):
+            if group.max_occurs == 0:
                 return 0
-            elif max_occurs is None:
-                continue
             elif group.max_occurs is None:
-                max_occurs = None
-            else:
-                max_occurs *= group.max_occurs
+                unbounded = True
+            elif not unbounded:
+                max_occurs *= group.max_occurs  # type: ignore[operator]
 
-        return max_occurs
+        return None if unbounded else max_occurs
 
     def copy(self) -> 'XsdGroup':
         group: XsdGroup = object.__new__(self.__class__)
         group.__dict__.update(self.__dict__)
         group.errors = self.errors[:]
         group._group = self._group[:]
+        group._containers = None
+        group._add_container(group._group)
+        group._subgroups = None  # the mapped paths start with the group itself
         return group
 
     __copy__ = copy
@@ -489,12 +734,16 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
                             msg = _("attribute 'maxOccurs' not allowed in a global group")
                             self.parse_error(msg, content_model)
 
-                    if content_model.tag in {XSD_SEQUENCE, XSD_ALL, XSD_CHOICE}:
+                    if content_model.tag in XSD_CONTENT_MODEL_TAGS:
                         self._parse_content_model(content_model)
                     else:
                         msg = _('unexpected tag %r')
                         self.parse_error(msg % content_model.tag, content_model)
 
+        # Content filled without using the mutable sequence API
+        self._add_container(self._group)
+        self._model_changed()
+
     def _parse_content_model(self, content_model: ElementType) -> None:
         self.model = local_name(content_model.tag)
         if self.model == 'all':
@@ -550,6 +799,10 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
         for item in self._group:
             if isinstance(item, XsdElement):
                 item.build()
+            elif item.is_group:
+                # The content is complete, record the pointless state of nested
+                # groups, that is checked by every iteration of the model.
+                cast(XsdGroup, item).is_pointless(parent=self)
 
         if self.redefine is not None:
             for group in self.redefine.iter_components(XsdGroup):
@@ -612,7 +865,9 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
             return model == 'choice' or len(self.ref or self) <= 1
 
     def is_empty(self) -> bool:
-        return not self.mixed and (not self._group or self.max_occurs == 0)
+        if self._cache_version != self._model_version:
+            self._check_cache()
+        return not self.mixed and self._empty
 
     def is_restriction(self, other: ModelParticleType, check_occurs: bool = True) -> bool:
         if not self._group:
@@ -1210,6 +1465,9 @@ class XsdGroup(XsdComponent, MutableSequence[ModelParticleType],
         yield text, children
 
 
+MutableSequence.register(XsdGroup)
+
+
 class Xsd11Group(XsdGroup):
     """
     Class for XSD 1.1 *model group* definitions.
@@ -1240,7 +1498,7 @@ class Xsd11Group(XsdGroup):
                 self.append(self.schema.xsd_element_class(child, self.schema, self, False))
             elif child.tag == XSD_ANY:
                 self._group.append(Xsd11AnyElement(child, self.schema, self))
-            elif child.tag in (XSD_SEQUENCE, XSD_CHOICE, XSD_ALL):
+            elif child.tag in XSD_CONTENT_MODEL_TAGS:
                 self._group.append(Xsd11Group(child, self.schema, self))
             elif child.tag == XSD_GROUP:
                 try:
@@ -1307,7 +1565,7 @@ class Xsd11Group(XsdGroup):
             self, other: Union[ModelParticleType, ParticleMixin, 'OccursCalculator']) -> bool:
         if not isinstance(other, XsdGroup):
             return super().has_occurs_restriction(other)
-        elif not self:
+        elif not self._group:
             return True
         elif self.effective_min_occurs < other.effective_min_occurs:
             return False
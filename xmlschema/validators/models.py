@@ -263,7 +263,9 @@ class ModelVisitor:
         elif self.group.model != 'all':
             return iter(self.group)
         else:
-            return (e for e in self.group.iter_elements() if not e.is_over(self.occurs[e]))
+            occurs = self.occurs
+            return (e for e in self.group.iter_elements()
+                    if e.max_occurs is None or e.max_occurs > occurs[e])
 
     def advance(self, match: bool = False) -> Iterator[AdvanceYieldedType]:
         """
@@ -348,7 +350,8 @@ class ModelVisitor:
             occurs[self.element] += 1
             self.match = True
             if self.group.model == 'all':
-                self.items = (e for e in self.group.iter_elements() if not e.is_over(occurs[e]))
+                self.items = (e for e in self.group.iter_elements()
+                              if e.max_occurs is None or e.max_occurs > occurs[e])
             elif not self.element.is_over(occurs[self.element]):
                 return
             elif self.group.model == 'choice' and self.element.is_ambiguous():
@@ -14,6 +14,20 @@ from ..aliases import ElementType, ModelParticleType
 from ..translation import gettext as _
 
 
+def _parse_occurs_value(value: str) -> Optional[int]:
+    """
+    Converts the value of a minOccurs/maxOccurs attribute to an integer.
+    Returns `None` if the value is not an integer.
+    """
+    if value.isdecimal():
+        return int(value)  # fast path for the common case of unsigned decimal digits
+
+    try:
+        return int(value)  # signed or whitespace padded values
+    except ValueError:
+        return None
+
+
 class ParticleMixin:
     """
     Mixin for objects related to XSD Particle Schema Components:
@@ -24,6 +38,7 @@ class ParticleMixin:
     :ivar min_occurs: the minOccurs property of the XSD particle. Defaults to 1.
     :ivar max_occurs: the maxOccurs property of the XSD particle. Defaults to 1, \
     a `None` value means 'unbounded'.
+    :cvar is_group: `True` if the particle is a model group, `False` otherwise.
     """
     name: Any
     maps: Any
@@ -31,6 +46,8 @@ class ParticleMixin:
     min_occurs: int = 1
     max_occurs: Optional[int] = 1
 
+    is_group = False  # `True` for model groups, cheaper than an isinstance() check
+
     def __init__(self, min_occurs: int = 1, max_occurs: Optional[int] = 1) -> None:
         self.min_occurs = min_occurs
         self.max_occurs = max_occurs
@@ -94,7 +111,7 @@ class ParticleMixin:
 
     def is_missing(self, occurs: int) -> bool:
         """Tests if provided occurrences are under the minimum."""
-        return not self.is_emptiable() if occurs == 0 else self.min_occurs > occurs
+        return self.min_occurs > occurs
 
     def is_over(self, occurs: int) -> bool:
         """Tests if provided occurrences are over the maximum."""
@@ -117,17 +134,15 @@ class ParticleMixin:
 
     def _parse_particle(self, elem: ElementType) -> None:
         if 'minOccurs' in elem.attrib:
-            try:
-                min_occurs = int(elem.attrib['minOccurs'])
-            except (TypeError, ValueError):
+            min_occurs = _parse_occurs_value(elem.attrib['minOccurs'])
+            if min_occurs is None:
                 msg = _("minOccurs value is not an integer value")
                 self.parse_error(msg)
+            elif min_occurs < 0:
+                msg = _("minOccurs value must be a non negative integer")
+                self.parse_error(msg)
             else:
-                if min_occurs < 0:
-                    msg = _("minOccurs value must be a non negative integer")
-                    self.parse_error(msg)
-                else:
-                    self.min_occurs = min_occurs
+                self.min_occurs = min_occurs
 
         max_occurs = elem.get('maxOccurs')
         if max_occurs is None:
@@ -137,16 +152,17 @@ class ParticleMixin:
         elif max_occurs == 'unbounded':
             self.max_occurs = None
         else:
-            try:
-                self.max_occurs = int(max_occurs)
-            except ValueError:
+            value = _parse_occurs_value(max_occurs)
+            if value is None:
                 msg = _("maxOccurs value must be a non negative integer or 'unbounded'")
                 self.parse_error(msg)
+            elif self.min_occurs > value:
+                self.max_occurs = value
+                msg = _("maxOccurs must be 'unbounded' or greater than minOccurs")
+                self.parse_error(msg)
+                self.max_occurs = None
             else:
-                if self.min_occurs > self.max_occurs:
-                    msg = _("maxOccurs must be 'unbounded' or greater than minOccurs")
-                    self.parse_error(msg)
-                    self.max_occurs = None
+                self.max_occurs = value
 
 
 class OccursCalculator: